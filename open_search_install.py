@@ -3,16 +3,38 @@
 import os
 import subprocess
 import argparse  # Importing argparse for command-line argument parsing
-import platform  # For detecting OS
+import base64
+import functools
+import hashlib
+import importlib.util
+import logging
+import re
+import selectors
+import shlex
+import shutil
+import stat
 import sys
+import tempfile
+import threading
 import time  # For sleep during startup
-import psutil  # For process monitoring
+
+try:
+    import rpm  # System python3-rpm bindings, used for in-process rpmdb queries
+except ImportError:
+    rpm = None
+
+try:
+    from orjson import loads as _json_loads  # Faster JSON parsing when available
+except ImportError:
+    from json import loads as _json_loads
+from concurrent.futures import ThreadPoolExecutor
 from open_search_install_config import (
     ADMIN_PASSWORD, 
     OPENSEARCH_VERSION, 
     DOWNLOAD_DIR,
     OPENSEARCH_RPM_URL,
     OPENSEARCH_RPM_FILENAME,
+    OPENSEARCH_RPM_SHA256,
     OPENSEARCH_CONFIG_DIR,
     OPENSEARCH_CONFIG_FILE,
     OPENSEARCH_JVM_FILE,
@@ -21,632 +43,962 @@ from open_search_install_config import (
     DASHBOARD_CONFIG_FILE,
     DASHBOARD_RPM_FILENAME,
     DASHBOARD_RPM_URL,
+    DASHBOARD_RPM_SHA256,
     DASHBOARD
 )
 
+log = logging.getLogger("opensearch_install")
+
+# Downloads live next to the script, whatever directory it is run from
+_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Local OpenSearch REST endpoint
+_API_URL = "https://localhost:9200"
+
+# Tagline the OpenSearch root endpoint answers with
+_EXPECTED_TAGLINE = "The OpenSearch Project: https://opensearch.org/"
+
+# Matches whole opensearch.yml lines for the settings we manage, commented out or not
+_STRIP_RE = re.compile(r'^[ \t]*#?[ \t]*(network\.host|discovery\.type|plugins\.security\.disabled)[ \t]*:.*(?:\n|\Z)',
+                       re.MULTILINE)
+
+# Matches whole jvm.options lines that set the heap size
+_HEAP_RE = re.compile(r'^[ \t]*-Xm[sx].*(?:\n|\Z)', re.MULTILINE)
+# Captures each heap option and its value across a whole jvm.options file
+_HEAP_OPT_RE = re.compile(r'^[ \t]*(-Xm[sx])(\S*)', re.MULTILINE)
+
+# Settings opensearch.yml must contain, and the block appended to set them
+_REQUIRED_OS_SETTINGS = {
+    'network.host': '0.0.0.0',
+    'discovery.type': 'single-node',
+    'plugins.security.disabled': 'false'
+}
+_OS_CONFIG_APPEND = """
+# Bind to the correct network interface. Use 0.0.0.0
+# to include all available interfaces or specify an IP address
+# assigned to a specific interface.
+network.host: 0.0.0.0
+
+# Unless you have already configured a cluster, you should set
+# discovery.type to single-node, or the bootstrap checks will
+# fail when you try to start the service.
+discovery.type: single-node
+
+# If you previously disabled the Security plugin in opensearch.yml,
+# be sure to re-enable it. Otherwise you can skip this setting.
+plugins.security.disabled: false
+"""
+
+# First curl release with --parallel-immediate (--parallel itself arrived in 7.66)
+_CURL_PARALLEL_VERSION = (7, 68)
+
+# HTTP statuses in download output: curl's --write-out lines and aria2c's error messages
+_HTTP_STATUS_RE = re.compile(r'^(\d{3})$|status=(\d{3})', re.MULTILINE)
+# aria2c exit codes for a missing resource and refused authorization, which a retry cannot fix
+_ARIA2C_CLIENT_ERRORS = (3, 24)
+
+# Python modules a full install imports on the way, and the packages that provide them
+_REQUIRED_MODULES = {
+    'yaml': 'PyYAML',
+    'requests': 'requests',
+    'urllib3': 'urllib3',
+}
+
+# Packages OpenSearch needs that the RPM does not pull in itself
+_DEPENDENCIES = ("java-11-openjdk-devel",)
+
+# JVM heap options jvm.options must contain
+_REQUIRED_JVM = {
+    '-Xms': '8g',
+    '-Xmx': '8g'
+}
+
+def _check_modules():
+    """Fail before anything is installed when a Python module the install imports later is missing"""
+    missing = [package for module, package in _REQUIRED_MODULES.items() if importlib.util.find_spec(module) is None]
+    if missing:
+        raise RuntimeError(f"Missing Python packages: {', '.join(missing)}; install them and re-run the installer")
+
+def _load_yaml(text):
+    """Parse YAML, importing PyYAML only when a config check needs it"""
+    import yaml
+    # libyaml-backed parser when PyYAML was built with it
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+def _setting_paths(config, key, prefix=()):
+    """Yield (path, value) for every spelling of a dotted setting in parsed YAML: flat, nested or mixed"""
+    if not isinstance(config, dict):
+        return
+    for name, value in config.items():
+        path = prefix + (str(name),)
+        dotted = '.'.join(path)
+        if dotted == key:
+            yield path, value
+        elif key.startswith(dotted + '.'):
+            yield from _setting_paths(value, key, path)
+
+def _yaml_value(value):
+    """Render a parsed YAML scalar the way it is written in the file"""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+@functools.lru_cache(maxsize=None)
+def _curl_version():
+    """Return the installed curl's (major, minor) version, or (0, 0) if it cannot be read"""
+    result = subprocess.run(["curl", "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    match = re.match(r'curl (\d+)\.(\d+)', result.stdout)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+def _stat_key(path):
+    """Identify a file version by mtime and size, catching rewrites within one timestamp tick"""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def _file_digest(path, algorithm='sha256'):
+    """Return the hex digest of a file, SHA-256 unless another hashlib algorithm is named"""
+    with open(path, 'rb', buffering=0) as f:
+        return hashlib.file_digest(f, algorithm).hexdigest()  # Hashes without holding the GIL
+
+def _nonempty(path):
+    """Return True if path exists and has content, using a single stat call"""
+    try:
+        return os.stat(path).st_size > 0
+    except FileNotFoundError:
+        return False
+
+def _drop_page_cache(path):
+    """Ask the kernel to evict a file's cached pages once nothing will read it again"""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        log.debug("Could not drop page cache for %s: %s", path, e)
+
 class OpenSearchInstaller:
-    def __init__(self, version, admin_password, debug=False):
+    _file_cache = {}  # path -> (mtime_ns, contents)
+    _file_cache_lock = threading.Lock()
+
+    def __init__(self, version, admin_password, debug=False, use_cache=True):
         self.version = version
         self.admin_password = admin_password
-        self.debug = debug
+        self.use_cache = use_cache
+        if debug:
+            log.setLevel(logging.DEBUG)  # Show the installer's debug output whatever the root level
+
+        # The API session is built on first use, so offline checks never import requests
+        self._http = None
+        self._http_lock = threading.Lock()
+
+        # Resolve download locations once; the directory is created on the first download
+        self.downloads_dir = os.path.join(_BASE_DIR, DOWNLOAD_DIR)
+        self.opensearch_target = (OPENSEARCH_RPM_URL(version),
+                                  os.path.join(self.downloads_dir, OPENSEARCH_RPM_FILENAME(version)),
+                                  OPENSEARCH_RPM_SHA256.get(version))
+        self.dashboard_target = (DASHBOARD_RPM_URL(version),
+                                 os.path.join(self.downloads_dir, DASHBOARD_RPM_FILENAME(version)),
+                                 DASHBOARD_RPM_SHA256.get(version))
+        self._fetched = set()  # RPMs already downloaded and verified by this run
+
+    def _new_session(self, retries):
+        """Build an API session for the local node, retrying failed requests the given number of times"""
+        import urllib3
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        # The local node serves a self-signed certificate
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+        # There is only one host, and at most a handful of checks run at once
+        session = Session()
+        # Encode the credentials once rather than on every request
+        credentials = base64.b64encode(f"admin:{self.admin_password}".encode()).decode()
+        session.headers["Authorization"] = f"Basic {credentials}"
+        # Localhost only: skip the per-request .netrc and proxy environment lookups
+        session.trust_env = False
+        session.verify = False
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=Retry(
+            total=retries, backoff_factor=0.2, status_forcelist=(502, 503, 504))))
+        return session
+
+    @property
+    def _session(self):
+        """Shared API session, reusing keep-alive connections across all checks"""
+        with self._http_lock:
+            if self._http is None:
+                self._http = self._new_session(retries=3)
+            return self._http
+
+    def _download(self, targets):
+        """Download (url, file, sha256) targets with a single curl or aria2c invocation where possible
+
+        Each file is fetched into a .part file so an interrupted transfer resumes
+        where it stopped, both on _run_download's retries and on the next run. RPMs
+        already on disk are reused without touching the network once their
+        checksum checks out; with use_cache off they are only re-fetched if the
+        server copy is newer. RPMs this run already fetched are not checked again.
+        """
+        pending = [target for target in targets
+                   if target[1] not in self._fetched and not (self.use_cache and self._cached(target))]
+        if not pending:
+            return [rpm_file for _, rpm_file, _ in targets]
+
+        os.makedirs(self.downloads_dir, exist_ok=True)
+        for rpm_url, _, _ in pending:
+            log.info("Downloading from: %s", rpm_url)
+            log.info("Downloading to: %s", self.downloads_dir)
+
+        # Fresh downloads go over several connections per file when aria2c is installed;
+        # revalidating RPMs already on disk needs curl's -z. curl older than 7.68, as
+        # shipped with RHEL/CentOS 7 and 8, lacks the parallel options and fetches one file at a time
+        if shutil.which("aria2c") and not any(os.path.exists(rpm_file) for _, rpm_file, _ in pending):
+            downloads = [self._aria2c_cmd(pending)]
+        elif len(pending) == 1 or _curl_version() >= _CURL_PARALLEL_VERSION:
+            downloads = [(self._curl_cmd(pending), None)]
+        else:
+            log.info("curl %s cannot download in parallel, fetching RPMs one at a time", '.'.join(map(str, _curl_version())))
+            downloads = [(self._curl_cmd([target]), None) for target in pending]
 
-    def download_opensearch(self):
-        print(f"Checking for {OPENSEARCH_SERVICE_NAME} RPM...")
-        # Create downloads directory if it doesn't exist
-        downloads_dir = os.path.join(os.getcwd(), DOWNLOAD_DIR)
-        os.makedirs(downloads_dir, exist_ok=True)
-        
-        opensearch_rpm_url = OPENSEARCH_RPM_URL(self.version)
-        opensearch_rpm_file = os.path.join(downloads_dir, OPENSEARCH_RPM_FILENAME(self.version))
-        
-        # Check if file already exists and has content
-        if os.path.exists(opensearch_rpm_file) and os.path.getsize(opensearch_rpm_file) > 0:
-            print(f"RPM file already exists at: {opensearch_rpm_file}")
-            print("Skipping download...")
-            return opensearch_rpm_file
-            
-        # Download the RPM file if it doesn't exist
         try:
-            print(f"Downloading from: {opensearch_rpm_url}")
-            print(f"Downloading to: {downloads_dir}")
-            subprocess.run(["curl", "-L", "-o", opensearch_rpm_file, opensearch_rpm_url], check=True)
-            print(f"Downloaded {OPENSEARCH_SERVICE_NAME} RPM to {opensearch_rpm_file}")
-            
-            # Verify the file exists and has size > 0
-            if not os.path.exists(opensearch_rpm_file) or os.path.getsize(opensearch_rpm_file) == 0:
-                raise Exception(f"Download failed or file is empty: {opensearch_rpm_file}")
-                
-            # Set appropriate permissions
-            subprocess.run(["sudo", "chmod", "644", opensearch_rpm_file], check=True)
-            return opensearch_rpm_file
+            for download_cmd, download_input in downloads:
+                self._run_download(download_cmd, download_input)
+
+            for rpm_url, rpm_file, expected_sha256 in pending:
+                part_file = rpm_file + ".part"
+                downloaded = _nonempty(part_file)
+                if downloaded:
+                    os.replace(part_file, rpm_file)
+                    log.info("Downloaded RPM to %s", rpm_file)
+                else:
+                    try:
+                        os.unlink(part_file)  # Empty leftover from a not-modified reply
+                    except FileNotFoundError:
+                        pass
+
+                    # Nothing new arrived, so the existing file must be usable
+                    if not _nonempty(rpm_file):
+                        raise Exception(f"Download failed or file is empty: {rpm_file}")
+                # A .sha256 record is only written once the file has been checked, so an
+                # unchanged file that already has one does not need the published digest again
+                unchecked = downloaded or not os.path.exists(rpm_file + ".sha256")
+                if expected_sha256:
+                    self._verify_digest(rpm_file, expected_sha256)
+                elif unchecked:
+                    published_sha512 = self._published_sha512(rpm_url)
+                    if published_sha512:
+                        self._verify_digest(rpm_file, published_sha512, 'sha512')
+                    else:
+                        log.warning("No checksum is known for %s, its integrity was not verified", rpm_file)
+                        unchecked = False  # Leave it unrecorded so the next run checks it again
+
+                # Record the digest so later runs can reuse the file without the network
+                if unchecked:
+                    with open(rpm_file + ".sha256", 'w') as f:
+                        f.write(f"{expected_sha256 or _file_digest(rpm_file)}  {os.path.basename(rpm_file)}\n")
+
+                # Set appropriate permissions
+                self._ensure_mode(rpm_file, 0o644)
+                self._fetched.add(rpm_file)
+            return [rpm_file for _, rpm_file, _ in targets]
         except Exception as e:
-            print(f"Error downloading RPM: {str(e)}")
+            log.error("Error downloading RPM: %s", e)
             raise
 
+    def _run_download(self, download_cmd, download_input=None):
+        """Run a download command, re-running it to resume from the .part files if it fails"""
+        # This loop is the only retry for both tools; each re-run resumes from the .part files
+        for attempt in range(1, 4):
+            result = subprocess.run(download_cmd, input=download_input, stdout=subprocess.PIPE, text=True)
+            if download_cmd[0] == "aria2c" and result.stdout.strip():
+                log.info("%s", result.stdout.rstrip())
+            if result.returncode == 0:
+                return
+
+            # A 4xx answer such as 403 or 404 comes back the same on every attempt. A 416 only
+            # means a resumed .part was already complete, which curl counts as success.
+            statuses = [int(code) for match in _HTTP_STATUS_RE.findall(result.stdout) for code in match if code]
+            client_error = any(400 <= status < 500 and status != 416 for status in statuses) or \
+                (download_cmd[0] == "aria2c" and result.returncode in _ARIA2C_CLIENT_ERRORS)
+            if attempt == 3 or client_error:
+                raise subprocess.CalledProcessError(result.returncode, download_cmd, output=result.stdout)
+            log.warning("%s exited with code %s, resuming download (attempt %s/3)...",
+                        download_cmd[0], result.returncode, attempt + 1)
+            time.sleep(2 ** attempt)
+
+    def _curl_cmd(self, pending):
+        """Build one curl command that fetches every target, in parallel when there are several"""
+        curl_cmd = ["curl", "-L", "--fail", "--remote-time", "--write-out", "%{http_code}\\n"]
+        if len(pending) > 1:
+            curl_cmd += ["--parallel", "--parallel-immediate", "--parallel-max", str(len(pending))]
+        for rpm_url, rpm_file, _ in pending:
+            curl_cmd += ["-C", "-", "-o", rpm_file + ".part"]
+            if os.path.exists(rpm_file):
+                log.info("RPM file already exists at: %s, checking for updates...", rpm_file)
+                curl_cmd += ["-z", rpm_file]
+            curl_cmd.append(rpm_url)
+        return curl_cmd
+
+    def _aria2c_cmd(self, pending):
+        """Build an aria2c command and input list that fetch each target in ranged segments
+
+        aria2c makes a single attempt; _run_download re-runs it, resuming from the
+        .part files, just as it does for curl.
+        """
+        aria2c_cmd = ["aria2c", "--input-file=-", f"--dir={self.downloads_dir}",
+                      f"--max-concurrent-downloads={len(pending)}",
+                      "--split=8", "--max-connection-per-server=8", "--min-split-size=4M",
+                      "--continue=true", "--remote-time=true", "--auto-file-renaming=false",
+                      "--file-allocation=none", "--max-tries=1", "--console-log-level=warn",
+                      "--summary-interval=0"]
+        aria2c_input = ''.join(f"{rpm_url}\n  out={os.path.basename(rpm_file)}.part\n"
+                               for rpm_url, rpm_file, _ in pending)
+        return aria2c_cmd, aria2c_input
+
+    def _cached(self, target):
+        """Reuse an RPM from an earlier run if it matches the configured or recorded checksum"""
+        _, rpm_file, expected_sha256 = target
+        if not _nonempty(rpm_file):
+            return False
+        if not expected_sha256:
+            try:
+                with open(rpm_file + ".sha256") as f:
+                    expected_sha256 = f.read().split()[0]
+            except (FileNotFoundError, IndexError):
+                return False
+        if _file_digest(rpm_file) != expected_sha256.lower():
+            log.info("Cached RPM %s does not match its checksum, downloading it again...", rpm_file)
+            os.unlink(rpm_file)  # Don't let curl's -z keep the bad file
+            return False
+        log.info("✓ Using cached RPM: %s", rpm_file)
+        self._ensure_mode(rpm_file, 0o644)
+        self._fetched.add(rpm_file)
+        return True
+
+    def _published_sha512(self, rpm_url):
+        """Fetch the SHA-512 digest published next to an RPM, or None if there is none"""
+        result = subprocess.run(["curl", "-sSfL", "--retry", "3", rpm_url + ".sha512"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        fields = result.stdout.split() if result.returncode == 0 else []
+        if fields and re.fullmatch(r'[0-9a-fA-F]{128}', fields[0]):
+            return fields[0]
+        return None
+
+    def _verify_digest(self, path, expected, algorithm='sha256'):
+        """Check a file against its expected digest, SHA-256 unless another algorithm is named"""
+        digest = _file_digest(path, algorithm)
+        if digest != expected.lower():
+            os.unlink(path)  # Don't let a later run treat the bad file as current
+            raise Exception(f"Checksum mismatch for {path}: expected {expected}, got {digest}")
+        log.info("✓ Checksum verified for %s", path)
+
+    def _ensure_mode(self, path, mode):
+        """Set file permissions, skipping the chmod when they already match"""
+        if (os.stat(path).st_mode & 0o777) != mode:
+            os.chmod(path, mode)
+
+    def _download_all(self):
+        """Download the OpenSearch and Dashboard RPMs in parallel"""
+        log.info("Checking for %s and %s RPMs...", OPENSEARCH_SERVICE_NAME, DASHBOARD_SERVICE_NAME)
+        return self._download([self.opensearch_target, self.dashboard_target])
+
+    def download_opensearch(self):
+        log.info("Checking for %s RPM...", OPENSEARCH_SERVICE_NAME)
+        return self._download([self.opensearch_target])[0]
+
     def download_dashboard(self):
-        print(f"Downloading {DASHBOARD_SERVICE_NAME} RPM...")
-        # Create downloads directory if it doesn't exist
-        downloads_dir = os.path.join(os.getcwd(), DOWNLOAD_DIR)
-        os.makedirs(downloads_dir, exist_ok=True)
-        
-        dashboard_rpm_url = DASHBOARD_RPM_URL(self.version)
-        dashboard_rpm_file = os.path.join(downloads_dir, DASHBOARD_RPM_FILENAME(self.version))
-        
-        # Download the RPM file
-        try:
-            print(f"Downloading from: {dashboard_rpm_url}")
-            print(f"Downloading to: {downloads_dir}")
-            subprocess.run(["curl", "-L", "-o", dashboard_rpm_file, dashboard_rpm_url], check=True)
-            print(f"Downloaded {DASHBOARD_SERVICE_NAME} RPM to {dashboard_rpm_file}")
-            
-            # Verify the file exists and has size > 0
-            if not os.path.exists(dashboard_rpm_file) or os.path.getsize(dashboard_rpm_file) == 0:
-                raise Exception(f"Download failed or file is empty: {dashboard_rpm_file}")
-                
-            # Set appropriate permissions
-            subprocess.run(["sudo", "chmod", "644", dashboard_rpm_file], check=True)
-            return dashboard_rpm_file
-        except Exception as e:
-            print(f"Error downloading RPM: {str(e)}")
-            raise
+        log.info("Checking for %s RPM...", DASHBOARD_SERVICE_NAME)
+        return self._download([self.dashboard_target])[0]
 
-    def install_deps(self):
-        print("\nChecking and installing dependencies...")
-        start_time = time.time()
-        try:
-            subprocess.run(["yum", "install", "java-11-openjdk-devel", "-y"], 
-                         check=True,
-                         text=True,
-                         stdout=sys.stdout,
-                         stderr=sys.stderr)
-            print(f"Dependencies installation took {time.time() - start_time:.1f} seconds")
-        except subprocess.CalledProcessError as e:
-            print(f"\nDependency installation failed with return code {e.returncode}")
-            if e.stderr:
-                print("Error output:")
-                print(e.stderr)
-            raise Exception(f"Dependency installation failed: {str(e)}")
+    def refresh_metadata(self, deps=()):
+        """Download repo metadata and missing dependencies ahead of the install; a failure here only means yum fetches them later"""
+        if deps:
+            log.info("Prefetching %s...", ', '.join(deps))
+            cmd = ["yum", "install", "--downloadonly", "-q", "-y", *deps]
+        else:
+            log.info("Refreshing yum metadata...")
+            cmd = ["yum", "makecache", "-q"]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+        if result.returncode != 0:
+            log.warning("yum %s exited with code %s, continuing", cmd[1], result.returncode)
+
+    def missing_deps(self):
+        """Return the dependencies that are not installed yet, so they can join the RPM's yum transaction"""
+        log.info("\nChecking dependencies...")
+        missing = []
+        for name in _DEPENDENCIES:
+            if self._package_installed(name):
+                log.info("✓ %s already installed", name)
+            else:
+                log.info("%s will be installed with %s", name, OPENSEARCH_SERVICE_NAME)
+                missing.append(name)
+        return missing
 
     def opensearch_install(self):
-        rpm_file = self.download_opensearch()  # Ensure the RPM is downloaded before installation
-        print(f"Installing {OPENSEARCH_SERVICE_NAME}...")
+        log.info("Installing %s...", OPENSEARCH_SERVICE_NAME)
         
         try:
-            # Install dependencies first
-            self.install_deps()
-            
-            # Then install the RPM with verbose output
-            print(f"\nInstalling {OPENSEARCH_SERVICE_NAME} RPM from {rpm_file}...")
-            
-            # Prepare the installation command with password in the command string
-            install_cmd = f"OPENSEARCH_INITIAL_ADMIN_PASSWORD={self.admin_password} yum localinstall {rpm_file} -y --verbose --nogpgcheck"
-            
-            if self.debug:
-                print("\nDebug: Executing command:")
-                print("----------------------------------------")
-                print(install_cmd)
-                print("----------------------------------------\n")
-                input("Press Enter to continue...")
-            
-            # Run the installation with real-time output
-            print("\nInstalling RPM (this may take a few minutes)...")
+            # Fetch repo metadata and the missing dependencies' packages while curl fetches
+            # the RPM, so the yum transaction starts with everything already in its cache
+            deps = self.missing_deps()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                metadata = executor.submit(self.refresh_metadata, deps)
+                rpm_file = self.download_opensearch()
+                metadata.result()
+            
+            # Install the RPM and any missing dependencies in one yum transaction with verbose output
+            log.info("\nInstalling %s RPM from %s...", OPENSEARCH_SERVICE_NAME, rpm_file)
+            
+            # Prepare the installation command, passing the password through the environment
+            install_cmd = ["yum", "install", rpm_file, *deps, "-y", "--verbose", "--nogpgcheck"]
+            install_env = {**os.environ, "OPENSEARCH_INITIAL_ADMIN_PASSWORD": self.admin_password}
+            
+            log.debug("\nDebug: Executing command:\n"
+                      "----------------------------------------\n"
+                      "OPENSEARCH_INITIAL_ADMIN_PASSWORD=*** %s\n"
+                      "----------------------------------------\n", shlex.join(install_cmd))
+            
+            # Run the installation with real-time output, keeping a copy in a log file
+            log.info("\nInstalling RPM (this may take a few minutes)...")
             start_time = time.time()
+            install_log = tempfile.NamedTemporaryFile('w+b', prefix='opensearch-install-', suffix='.log', delete=False)
+            log.info("Installer output is also being written to %s", install_log.name)
             
-            # Start the process
-            process = subprocess.Popen(
+            # Start the process; leaving the block closes both pipes and reaps yum
+            with install_log, subprocess.Popen(
                 install_cmd,
-                shell=True,
-                stdout=sys.stdout,
-                stderr=sys.stderr,
-                text=True
-            )
-            
-            pid = process.pid
-            print(f"Started shell process with PID: {pid}")
-            
-            # Function to check if process or any of its children are running
-            def is_running(pid):
-                try:
-                    process = psutil.Process(pid)
-                    children = process.children(recursive=True)
-                    
-                    # Check if main process is running and not defunct
-                    if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
-                        if self.debug:
-                            print(f"Main process {pid} is running (status: {process.status()})")
-                            for child in children:
-                                try:
-                                    print(f"Child process {child.pid} ({child.name()}) status: {child.status()}")
-                                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                    pass
-                        return True
-                        
-                    # If main process is defunct, check children
-                    if process.status() == psutil.STATUS_ZOMBIE:
-                        if self.debug:
-                            print(f"Main process {pid} is defunct")
-                        # Only consider running if there are non-defunct children
-                        return any(child.is_running() and child.status() != psutil.STATUS_ZOMBIE 
-                                 for child in children)
-                                 
-                except psutil.NoSuchProcess:
-                    # Check if any children are still running
-                    for child in psutil.process_iter():
-                        try:
-                            if child.ppid() == pid and child.status() != psutil.STATUS_ZOMBIE:
-                                if self.debug:
-                                    print(f"Child process {child.pid} ({child.name()}) is still running")
-                                return True
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            pass
-                    return False
-                    
-                return False
-            
-            # Monitor the process until it completes
-            max_wait = 300  # Maximum wait time in seconds
-            start = time.time()
-            
-            while (time.time() - start) < max_wait:
-                if not is_running(pid):
-                    print("Installation processes completed")
-                    break
-                    
-                if self.debug:
-                    print("\nChecking process status...")
+                env=install_env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=-1,  # Block-buffered pipe readers
+                pipesize=1 << 20  # Room for yum to keep writing between selector wakeups
+            ) as process:
+                log.info("Started yum process with PID: %s", process.pid)
                 
-                time.sleep(5)  # Wait 5 seconds before next check
+                # Drain both pipes as data arrives until yum and its children close them
+                with selectors.DefaultSelector() as selector:
+                    # Echo raw bytes straight to the binary streams, skipping the text layer
+                    selector.register(process.stdout, selectors.EVENT_READ, sys.stdout.buffer)
+                    selector.register(process.stderr, selectors.EVENT_READ, sys.stderr.buffer)
+                    while selector.get_map():
+                        for key, _ in selector.select(timeout=0.5):
+                            chunk = key.fileobj.read1(32768)
+                            if not chunk:
+                                selector.unregister(key.fileobj)
+                                continue
+                            key.data.write(chunk)
+                            key.data.flush()
+                            install_log.write(chunk)
+            log.info("Installation processes completed")
                 
             # Get the final return code
-            return_code = process.wait()
-            if return_code != 0:
-                raise Exception(f"Installation command failed with return code {return_code}")
+            if process.returncode != 0:
+                log.error("Installer output kept in %s", install_log.name)
+                raise subprocess.CalledProcessError(process.returncode, install_cmd)
+            os.unlink(install_log.name)
+            # yum has read the RPM for the last time; free that memory before the JVM starts
+            _drop_page_cache(rpm_file)
 
             elapsed_time = time.time() - start_time
-            print(f"Installation process took {elapsed_time:.1f} seconds")
+            log.info("Installation process took %.1f seconds", elapsed_time)
             
-            # Add a small delay to ensure all post-install scripts complete
-            print("Waiting for post-install processes to complete...")
-            time.sleep(10)
+            # yum only returns once the RPM's scriptlets have run, so check the result right away
+            self.verify_installation()
                 
         except subprocess.CalledProcessError as e:
-            print(f"\nInstallation failed with return code {e.returncode}")
+            log.error("\nInstallation failed with return code %s", e.returncode)
             raise Exception(f"Installation failed: {str(e)}")
         except Exception as e:
-            print(f"\nInstallation failed: {str(e)}")
+            log.error("\nInstallation failed: %s", e)
             raise
 
     def verify_installation(self):
         """Verify that the installation completed and all necessary files are present"""
-        print("\nVerifying installation completion...")
-        print(f"Config file path: {OPENSEARCH_CONFIG_FILE}")
-        print(f"JVM file path: {OPENSEARCH_JVM_FILE}")
+        log.info("\nVerifying installation completion...")
+        log.info("Config file path: %s", OPENSEARCH_CONFIG_FILE)
+        log.info("JVM file path: %s", OPENSEARCH_JVM_FILE)
         
-        max_attempts = 90  # Maximum number of attempts
-        attempt = 0
-        while attempt < max_attempts:
-            attempt += 1
-            print(f"\nVerification attempt {attempt}/{max_attempts}")
-            
-            # Check 1: Package installed in yum
-            yum_check = subprocess.run(
-                "yum list installed opensearch",
-                shell=True,
-                capture_output=True,
-                text=True
-            ).returncode == 0
-            
-            # Check 2: Config file exists
-            config_check = os.path.exists(OPENSEARCH_CONFIG_FILE)
-            
-            # Check 3: JVM file exists
-            jvm_check = os.path.exists(OPENSEARCH_JVM_FILE)
-            
-            # Print status
-            print(f"✓ Package installed: {'Yes' if yum_check else 'No'}")
-            print(f"✓ Config file exists: {'Yes' if config_check else 'No'}")
-            print(f"✓ JVM file exists: {'Yes' if jvm_check else 'No'}")
-            
-            if yum_check and config_check and jvm_check:
-                print("\n✓ All installation checks passed!")
-                return True
-            
-            print("Waiting for installation to complete...")
-            time.sleep(2)  # Wait 2 seconds between checks
+        # yum has synced the rpmdb and laid down the files by the time it returns,
+        # so a single check is enough
+        # Check 1: Package installed
+        installed_version = self._installed_version(OPENSEARCH_SERVICE_NAME)
+        package_check = installed_version is not None
+        
+        # Check 2: Config file exists
+        config_check = os.path.exists(OPENSEARCH_CONFIG_FILE)
         
-        raise Exception("Installation verification timed out - required files not found")
+        # Check 3: JVM file exists
+        jvm_check = os.path.exists(OPENSEARCH_JVM_FILE)
+        
+        # Print status
+        log.info("✓ Package installed: %s", installed_version or 'No')
+        log.info("✓ Config file exists: %s", 'Yes' if config_check else 'No')
+        log.info("✓ JVM file exists: %s", 'Yes' if jvm_check else 'No')
+        
+        if package_check and config_check and jvm_check:
+            log.info("\n✓ All installation checks passed!")
+            return True
+        
+        raise Exception("Installation verification failed - required package or files not found")
 
-    def service_enable(self):
-        print(f"Enabling {OPENSEARCH_SERVICE_NAME} service...")
-        try:
-            subprocess.run(["sudo", "systemctl", "enable", OPENSEARCH_SERVICE_NAME], check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error enabling {OPENSEARCH_SERVICE_NAME} service: {e}")
-            sys.exit(1)
+    def _installed_version(self, name):
+        """Return a package's installed VERSION-RELEASE from one rpmdb query, or None if it is absent"""
+        if rpm is not None:
+            for header in rpm.TransactionSet().dbMatch('name', name):
+                # rpm bindings older than 4.16 (RHEL 8) return header strings as bytes
+                version, release = (value.decode() if isinstance(value, bytes) else value
+                                    for value in (header['version'], header['release']))
+                return f"{version}-{release}"
+            return None
+        result = subprocess.run(["rpm", "-q", "--queryformat", "%{VERSION}-%{RELEASE}\\n", name],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL,
+                                text=True)
+        return result.stdout.splitlines()[0] if result.returncode == 0 else None
 
-    def service_start(self):
-        print(f"Starting {OPENSEARCH_SERVICE_NAME} service...")
-        try:
-            subprocess.run(["sudo", "systemctl", "start", OPENSEARCH_SERVICE_NAME], check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error starting {OPENSEARCH_SERVICE_NAME} service: {e}")
-            sys.exit(1)
+    def _package_installed(self, name):
+        """Check the rpmdb for a package, in-process when the rpm bindings are available"""
+        if rpm is not None:
+            return any(True for _ in rpm.TransactionSet().dbMatch('name', name))
+        return subprocess.run(["rpm", "-q", name],
+                              stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL).returncode == 0
 
-    def service_verify(self):
-        print(f"Verifying {OPENSEARCH_SERVICE_NAME} service status...")
+    def _enable_now(self, name):
+        """Enable and start a unit with a single systemctl call"""
+        log.info("Enabling and starting %s service...", name)
+        subprocess.run(["sudo", "systemctl", "enable", "--now", name], check=True)
+
+    def service_enable_now(self):
+        """Enable and start the service with a single systemctl call"""
         try:
-            subprocess.run(["sudo", "systemctl", "status", OPENSEARCH_SERVICE_NAME], check=True)
+            self._enable_now(OPENSEARCH_SERVICE_NAME)
         except subprocess.CalledProcessError as e:
-            print(f"Error verifying {OPENSEARCH_SERVICE_NAME} service: {e}")
-            sys.exit(1)
+            raise RuntimeError(f"Error enabling and starting {OPENSEARCH_SERVICE_NAME} service: {e}") from e
+
+    def _unit_state(self, name):
+        """Read a unit's ActiveState and SubState with one unprivileged systemctl show call"""
+        output = subprocess.run(
+            ["systemctl", "show", "--property=ActiveState,SubState", name],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        ).stdout
+        state = dict(line.split('=', 1) for line in output.splitlines() if '=' in line)
+        log.debug("%s state: %s/%s", name, state.get('ActiveState'), state.get('SubState'))
+        return state.get('ActiveState'), state.get('SubState')
+
+    def _wait_unit_active(self, timeout=120, name=OPENSEARCH_SERVICE_NAME):
+        """Wait for systemd to report the unit active and running, giving up early if it fails"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            active, sub = self._unit_state(name)
+            if (active, sub) == ('active', 'running'):
+                log.info("✓ %s service is active", name)
+                return True
+            if active == "failed":
+                return False
+            time.sleep(0.5)
+        return False
+
+    def _wait_api_ready(self, timeout=120, initial=0.25, factor=1.5, max_delay=2.0):
+        """Poll the API with exponential backoff until it serves its root document or the timeout expires"""
+        from requests.exceptions import RequestException
+        start = time.monotonic()
+        deadline = start + timeout
+        delay = initial
+        # This loop is the retry policy; adapter retries would stretch one probe past the deadline
+        with self._new_session(retries=0) as session:
+            while time.monotonic() < deadline:
+                try:
+                    result = session.get(_API_URL, timeout=min(2, max(deadline - time.monotonic(), 0.1)))
+                    # A node still starting up can answer before it serves real responses
+                    if result.ok and 'tagline' in _json_loads(result.content):
+                        log.info("✓ %s API ready after %.1f seconds", OPENSEARCH_SERVICE_NAME, time.monotonic() - start)
+                        return True
+                except (RequestException, ValueError):
+                    pass
+                time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+                delay = min(delay * factor, max_delay)
+        return False
+
+    def _wait_ready(self, timeout=120):
+        """Wait for the unit to go active and then for the API to answer, within one deadline"""
+        deadline = time.monotonic() + timeout
+        if not self._wait_unit_active(deadline - time.monotonic()):
+            log.error("✗ %s service did not become active", OPENSEARCH_SERVICE_NAME)
+            return False
+        if not self._wait_api_ready(deadline - time.monotonic()):
+            log.error("✗ %s API did not become ready in time", OPENSEARCH_SERVICE_NAME)
+            return False
+        return True
 
     def service_wrapper(self):
         """Wrapper function to enable and start the service, then wait for startup"""
-        self.service_enable()
-        self.service_start()
-        print(f"\nWaiting 30 seconds for {OPENSEARCH_SERVICE_NAME} to fully start...")
-        time.sleep(30)
-        self.service_verify()
+        self.service_enable_now()
+        log.info("\nWaiting for %s to fully start...", OPENSEARCH_SERVICE_NAME)
+        if not self._wait_ready():
+            raise RuntimeError(f"{OPENSEARCH_SERVICE_NAME} did not become ready; "
+                               f"check 'systemctl status {OPENSEARCH_SERVICE_NAME}' and 'journalctl -u {OPENSEARCH_SERVICE_NAME}'")
+
+    def _update_if_needed(self, check, update):
+        """Run update only when check reports the current settings are wrong"""
+        if not check():
+            update()
+
+    def _run_concurrently(self, *calls):
+        """Run independent calls on a thread pool, re-raising the first failure once all have finished"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            jobs = [executor.submit(call) for call in calls]
+        errors = [job.exception() for job in jobs if job.exception() is not None]
+        for error in errors[1:]:
+            log.error("✗ %s", error)
+        if errors:
+            raise errors[0]
+        return [job.result() for job in jobs]
 
     def configuration_wrapper(self):
-        """Wrapper function to handle all configuration and verification steps"""
-        self.opensearch_config_update()
-        self.set_jvm_heap()
-        self.api_verify()
-        self.plugins_verify()
+        """Wrapper function to apply the config and JVM file edits concurrently"""
+        self._run_concurrently(lambda: self._update_if_needed(self.verify_config, self.opensearch_config_update),
+                               lambda: self._update_if_needed(self.check_jvm_heap, self.set_jvm_heap))
+
+    def verification_wrapper(self):
+        """Wrapper function to run the API, plugins and configuration checks concurrently"""
+        checks = {"API": self.api_verify, "Plugins": self.plugins_verify, "Configuration": self.verify_config}
+        results = dict(zip(checks, self._run_concurrently(*checks.values())))
+        failed = [name for name, passed in results.items() if not passed]
+        if failed:
+            log.error("\n✗ Post-install verification failed: %s", ', '.join(failed))
+            return False
+        log.info("\n✓ Post-install verification passed: %s", ", ".join(results))
+        return True
+
+    def _api_get(self, path, check, **params):
+        """GET an API path on the shared session, logging the check as failed if the node does not answer"""
+        from requests.exceptions import RequestException
+        try:
+            result = self._session.get(f"{_API_URL}{path}", params=params, timeout=5)
+        except RequestException as e:
+            log.error("\n✗ %s %s check failed - Service not responding\n"
+                      "Error output:\n%s", OPENSEARCH_SERVICE_NAME, check, e)
+            return None
+        log.debug("\nDebug: Request:\nGET %s (HTTP %s)", result.url, result.status_code)
+        return result
 
     def api_verify(self):
-        print(f"\nVerifying {OPENSEARCH_SERVICE_NAME} API...")
+        log.info("\nVerifying %s API...", OPENSEARCH_SERVICE_NAME)
+        result = self._api_get("/", "API")
+        if result is None:
+            return False
+        
+        log.info("\nAPI Response:\n%s", result.text)
+        
         try:
-            result = subprocess.run(
-                ["curl", "-X", "GET", "https://localhost:9200",
-                 "-u", f"admin:{self.admin_password}",
-                 "--insecure",
-                 "--silent"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            print("\nAPI Response:")
-            print(result.stdout)
-            
-            if self.debug:
-                print("\nDebug: Curl command:")
-                print(f"curl -X GET https://localhost:9200 -u admin:{self.admin_password} --insecure --silent")
-            
-            try:
-                import json
-                response = json.loads(result.stdout)
-                if response.get("tagline") == "The OpenSearch Project: https://opensearch.org/":
-                    print(f"\n✓ {OPENSEARCH_SERVICE_NAME} API check passed - Service is running and responding correctly")
-                    print(f"Version: {response.get('version', {}).get('number', 'unknown')}")
-                    print(f"Cluster name: {response.get('cluster_name', 'unknown')}")
-                    return True
-                else:
-                    print(f"\n✗ {OPENSEARCH_SERVICE_NAME} API check failed - Unexpected response")
-                    print("Expected tagline not found in response")
-                    return False
-            except json.JSONDecodeError:
-                print(f"\n✗ {OPENSEARCH_SERVICE_NAME} API check failed - Invalid JSON response")
-                if self.debug:
-                    print("Raw response received:")
-                    print(repr(result.stdout))
-                return False
-                
-        except subprocess.CalledProcessError as e:
-            print(f"\n✗ {OPENSEARCH_SERVICE_NAME} API check failed - Service not responding")
-            if e.stderr:
-                print("Error output:")
-                print(e.stderr)
+            response = _json_loads(result.content)
+        except ValueError:  # Both json and orjson decode errors subclass ValueError
+            log.error("\n✗ %s API check failed - Invalid JSON response", OPENSEARCH_SERVICE_NAME)
+            log.debug("Raw response received:\n%r", result.text)
             return False
+        
+        if isinstance(response, dict) and response.get("tagline") == _EXPECTED_TAGLINE:
+            log.info("\n✓ %s API check passed - Service is running and responding correctly\n"
+                     "Version: %s\n"
+                     "Cluster name: %s",
+                     OPENSEARCH_SERVICE_NAME,
+                     response.get('version', {}).get('number', 'unknown'),
+                     response.get('cluster_name', 'unknown'))
+            return True
+        log.error("\n✗ %s API check failed - Unexpected response\n"
+                  "Expected tagline not found in response", OPENSEARCH_SERVICE_NAME)
+        return False
 
     def plugins_verify(self):
-        print(f"\nVerifying {OPENSEARCH_SERVICE_NAME} Plugins...")
+        log.info("\nVerifying %s Plugins...", OPENSEARCH_SERVICE_NAME)
+        result = self._api_get("/_cat/plugins", "Plugins", format="json", h="name,component,version")
+        if result is None:
+            return False
+        
         try:
-            result = subprocess.run(
-                ["curl", "-X", "GET", "https://localhost:9200/_cat/plugins?v",
-                 "-u", f"admin:{self.admin_password}",
-                 "--insecure",
-                 "--silent"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            print("\nPlugins Response:")
-            print(result.stdout if result.stdout.strip() else "No plugins installed")
-            
-            if self.debug:
-                print("\nDebug: Curl command:")
-                print(f"curl -X GET https://localhost:9200/_cat/plugins?v -u admin:{self.admin_password} --insecure --silent")
-            
-            return True
-                
-        except subprocess.CalledProcessError as e:
-            print(f"\n✗ {OPENSEARCH_SERVICE_NAME} Plugins check failed - Service not responding")
-            if e.stderr:
-                print("Error output:")
-                print(e.stderr)
+            plugins = _json_loads(result.content)
+            listing = "\n".join(f"{plugin['name']} {plugin['component']} {plugin['version']}" for plugin in plugins)
+        except (ValueError, TypeError, KeyError):
+            log.error("\n✗ %s Plugins check failed - Unexpected response", OPENSEARCH_SERVICE_NAME)
+            log.debug("Raw response received:\n%r", result.text)
             return False
+        
+        log.info("\nPlugins Response:\n%s", listing or "No plugins installed")
+        return True
 
     def dashboard_install(self):
         """Install and configure the Dashboard service"""
-        print(f"\nChecking for {DASHBOARD_SERVICE_NAME} RPM...")
-        # Create downloads directory if it doesn't exist
-        downloads_dir = os.path.join(os.getcwd(), DOWNLOAD_DIR)
-        os.makedirs(downloads_dir, exist_ok=True)
-        
-        dashboard_rpm_url = DASHBOARD_RPM_URL(self.version)
-        dashboard_rpm_file = os.path.join(downloads_dir, DASHBOARD_RPM_FILENAME(self.version))
-        
-        # Check if file already exists and has content
-        if os.path.exists(dashboard_rpm_file) and os.path.getsize(dashboard_rpm_file) > 0:
-            print(f"RPM file already exists at: {dashboard_rpm_file}")
-            print("Skipping download...")
-        else:
-            # Download the RPM file if it doesn't exist
-            try:
-                print(f"Downloading from: {dashboard_rpm_url}")
-                print(f"Downloading to: {downloads_dir}")
-                subprocess.run(["curl", "-L", "-o", dashboard_rpm_file, dashboard_rpm_url], check=True)
-                print(f"Downloaded {DASHBOARD_SERVICE_NAME} RPM to {dashboard_rpm_file}")
-                
-                # Verify the file exists and has size > 0
-                if not os.path.exists(dashboard_rpm_file) or os.path.getsize(dashboard_rpm_file) == 0:
-                    raise Exception(f"Download failed or file is empty: {dashboard_rpm_file}")
-                    
-                # Set appropriate permissions
-                subprocess.run(["sudo", "chmod", "644", dashboard_rpm_file], check=True)
-            except Exception as e:
-                print(f"Error downloading RPM: {str(e)}")
-                raise
+        dashboard_rpm_file = self.download_dashboard()
 
         # Now proceed with installation
         try:
             # Install the RPM
-            print(f"\nInstalling {DASHBOARD_SERVICE_NAME} RPM from {dashboard_rpm_file}...")
+            log.info("\nInstalling %s RPM from %s...", DASHBOARD_SERVICE_NAME, dashboard_rpm_file)
             subprocess.run(["sudo", "yum", "localinstall", dashboard_rpm_file, "-y", "--nogpgcheck"], check=True)
+            _drop_page_cache(dashboard_rpm_file)
             
-            # Enable the dashboard service
-            print(f"Enabling {DASHBOARD_SERVICE_NAME} service...")
-            subprocess.run(["sudo", "systemctl", "enable", DASHBOARD_SERVICE_NAME], check=True)
-            
-            # Start the dashboard service
-            print(f"Starting {DASHBOARD_SERVICE_NAME} service...")
-            subprocess.run(["sudo", "systemctl", "start", DASHBOARD_SERVICE_NAME], check=True)
+            # Enable and start the dashboard service
+            self._enable_now(DASHBOARD_SERVICE_NAME)
             
             # Verify the dashboard service status
-            print(f"Verifying {DASHBOARD_SERVICE_NAME} service status...")
-            subprocess.run(["sudo", "systemctl", "status", DASHBOARD_SERVICE_NAME], check=True)
+            log.info("Verifying %s service status...", DASHBOARD_SERVICE_NAME)
+            if not self._wait_unit_active(name=DASHBOARD_SERVICE_NAME):
+                log.error("\n✗ %s service did not become active and running", DASHBOARD_SERVICE_NAME)
+                return False
             
-            print(f"✓ {DASHBOARD_SERVICE_NAME} service installed successfully")
+            log.info("✓ %s service installed successfully", DASHBOARD_SERVICE_NAME)
             return True
         except subprocess.CalledProcessError as e:
-            print(f"\n✗ Error installing {DASHBOARD_SERVICE_NAME} service: {e}")
+            log.error("\n✗ Error installing %s service: %s", DASHBOARD_SERVICE_NAME, e)
             if hasattr(e, 'stderr') and e.stderr:
-                print("Error output:")
-                print(e.stderr)
+                log.error("Error output:")
+                log.error("%s", e.stderr)
             return False
 
-    def verify_config(self):
-        print(f"\nVerifying {OPENSEARCH_SERVICE_NAME} configuration...")
-        required_settings = {
-            'network.host': '0.0.0.0',
-            'discovery.type': 'single-node',
-            'plugins.security.disabled': 'false'
-        }
-        
+    def _read_cached(self, path):
+        """Read a file, reusing the previous contents if its mtime and size are unchanged"""
+        key = _stat_key(path)
+        with self._file_cache_lock:
+            hit = self._file_cache.get(path)
+        if hit and hit[0] == key:
+            return hit[1]
+        with open(path, 'r') as f:
+            data = f.read()
+        with self._file_cache_lock:
+            self._file_cache[path] = (key, data)
+        return data
+
+    def _update_cache(self, path, data):
+        """Record contents we just wrote so the follow-up verify skips the re-read"""
+        key = _stat_key(path)
+        with self._file_cache_lock:
+            self._file_cache[path] = (key, data)
+
+    def _atomic_write(self, path, data):
+        """Replace a file's contents atomically, keeping its mode and ownership"""
+        st = os.stat(path)
+        tmp = tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path), delete=False)
         try:
-            with open(OPENSEARCH_CONFIG_FILE, 'r') as f:
-                config_content = f.read()
-            
+            with tmp:
+                tmp.write(data)
+                os.fchmod(tmp.fileno(), stat.S_IMODE(st.st_mode))
+                os.fchown(tmp.fileno(), st.st_uid, st.st_gid)
+                tmp.flush()
+                os.fsync(tmp.fileno())  # Data must be on disk before the rename makes it visible
+            os.replace(tmp.name, path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+        self._update_cache(path, data)
+
+    def verify_config(self, text=None):
+        """Verify the required settings, taking just-written contents to skip reading the file"""
+        log.info("\nVerifying %s configuration...", OPENSEARCH_SERVICE_NAME)
+        required_settings = _REQUIRED_OS_SETTINGS
 
-            # Parse the YAML content line by line to handle comments
-            lines = config_content.split('\n')
+        try:
+            config_content = text if text is not None else self._read_cached(OPENSEARCH_CONFIG_FILE)
+
+            # Parse the YAML once; settings may be written flat or nested
+            config = _load_yaml(config_content) or {}
             found_settings = {}
-            
-            for line in lines:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if ': ' in line:
-                        key, value = line.split(': ', 1)
-                        if key in required_settings:
-                            found_settings[key] = value
+            duplicates = []
+            for key in required_settings:
+                values = [value for _, value in _setting_paths(config, key)]
+                if len(values) > 1:
+                    duplicates.append(key)
+                elif values:
+                    found_settings[key] = _yaml_value(values[0])
             
             # Check if all required settings are present and correct
             all_correct = True
             for key, expected_value in required_settings.items():
+                # OpenSearch refuses to start when a setting is given both flat and nested
+                if key in duplicates:
+                    log.error("✗ Duplicate setting: %s is set more than once", key)
+                    all_correct = False
+                    continue
                 if key not in found_settings:
-                    print(f"✗ Missing setting: {key}")
+                    log.error("✗ Missing setting: %s", key)
                     all_correct = False
                 elif found_settings[key] != expected_value:
-                    print(f"✗ Incorrect value for {key}. Expected: {expected_value}, Found: {found_settings[key]}")
+                    log.error("✗ Incorrect value for %s. Expected: %s, Found: %s", key, expected_value, found_settings[key])
                     all_correct = False
-                elif self.debug:
-                    print(f"✓ Verified {key}: {found_settings[key]}")
+                else:
+                    log.debug("✓ Verified %s: %s", key, found_settings[key])
             
             if all_correct:
-                print("✓ All configuration settings are correct")
+                log.info("✓ All configuration settings are correct")
                 return True
             else:
-                print("✗ Some configuration settings are missing or incorrect")
+                log.error("✗ Some configuration settings are missing or incorrect")
                 return False
                 
         except Exception as e:
-            print(f"✗ Error verifying configuration: {str(e)}")
+            log.error("✗ Error verifying configuration: %s", e)
             return False
 
     def opensearch_config_update(self):
-        print("\nUpdating configuration...")
+        log.info("\nUpdating configuration...")
         
-        # Configuration to add
-        new_config = """
-# Bind to the correct network interface. Use 0.0.0.0
-# to include all available interfaces or specify an IP address
-# assigned to a specific interface.
-network.host: 0.0.0.0
-
-# Unless you have already configured a cluster, you should set
-# discovery.type to single-node, or the bootstrap checks will
-# fail when you try to start the service.
-discovery.type: single-node
-
-# If you previously disabled the Security plugin in opensearch.yml,
-# be sure to re-enable it. Otherwise you can skip this setting.
-plugins.security.disabled: false
-"""
         try:
             # Read existing config
-            with open(OPENSEARCH_CONFIG_FILE, 'r') as f:
-                existing_config = f.read()
+            existing_config = self._read_cached(OPENSEARCH_CONFIG_FILE)
 
-            # Remove any existing settings we're about to add
-            lines = existing_config.split('\n')
-            filtered_lines = []
-            skip_next = False
-            
-            for line in lines:
-                if skip_next:
-                    skip_next = False
-                    continue
-                    
-                # Skip comments before our settings and the settings themselves
-                if any(setting in line for setting in ['network.host:', 'discovery.type:', 'plugins.security.disabled:']):
-                    skip_next = True  # Skip the next line if it's a value
-                    continue
-                if line.strip().startswith('#') and any(text in line for text in ['network.host', 'discovery.type', 'plugins.security.disabled']):
-                    continue
-                    
-                filtered_lines.append(line)
+            # Remove any existing settings we're about to add, along with
+            # commented-out copies of them
+            filtered_config = _STRIP_RE.sub('', existing_config)
+
+            # The line filter only sees flat keys; a nested spelling left behind would clash
+            # with the appended setting, so leave the file alone and ask for it to be flattened
+            config = _load_yaml(filtered_config) or {}
+            nested = sorted({key for key in _REQUIRED_OS_SETTINGS for _ in _setting_paths(config, key)})
+            if nested:
+                raise RuntimeError(f"{OPENSEARCH_CONFIG_FILE} sets {', '.join(nested)} as nested YAML; "
+                                   f"rewrite them as flat dotted keys (e.g. 'network.host: ...') and re-run")
 
             # Combine filtered config with new settings
-            updated_config = '\n'.join(filtered_lines).strip() + new_config
+            updated_config = filtered_config.strip() + _OS_CONFIG_APPEND
 
             # Write updated config
-            with open(OPENSEARCH_CONFIG_FILE, 'w') as f:
-                f.write(updated_config)
+            self._atomic_write(OPENSEARCH_CONFIG_FILE, updated_config)
 
-            print("✓ Configuration updated successfully")
+            log.info("✓ Configuration updated successfully")
             
-            if self.debug:
-                print("\nDebug: Updated configuration:")
-                print(updated_config)
+            log.debug("\nDebug: Updated configuration:\n%s", updated_config)
             
             # Verify the configuration after update
-            self.verify_config()
+            if not self.verify_config(text=updated_config):
+                raise RuntimeError(f"{OPENSEARCH_CONFIG_FILE} still fails verification after the update")
                 
         except Exception as e:
-            print(f"✗ Error updating configuration: {str(e)}")
+            log.error("✗ Error updating configuration: %s", e)
             raise
 
     def set_jvm_heap(self):
-        print("\nUpdating JVM heap settings...")
+        log.info("\nUpdating JVM heap settings...")
         
         try:
-            # Read existing JVM options
-            with open(OPENSEARCH_JVM_FILE, 'r') as f:
-                lines = f.readlines()
+            # Read existing JVM options, dropping any Xms and Xmx settings
+            updated_jvm = _HEAP_RE.sub('', self._read_cached(OPENSEARCH_JVM_FILE))
+            if updated_jvm and not updated_jvm.endswith('\n'):
+                updated_jvm += '\n'
             
-            # Remove existing Xms and Xmx settings
-            new_lines = []
-            for line in lines:
-                if not line.strip().startswith('-Xms') and not line.strip().startswith('-Xmx'):
-                    new_lines.append(line)
-            
-            # Add our heap settings
-            new_lines.append('-Xms8g\n')
-            new_lines.append('-Xmx8g\n')
+            # Add our heap settings; these are now the only heap lines in the file
+            updated_jvm += ''.join(f'{key}{value}\n' for key, value in _REQUIRED_JVM.items())
             
             # Write updated config
-            with open(OPENSEARCH_JVM_FILE, 'w') as f:
-                f.writelines(new_lines)
+            self._atomic_write(OPENSEARCH_JVM_FILE, updated_jvm)
             
-            print("✓ JVM heap settings updated successfully")
+            log.info("✓ JVM heap settings updated successfully")
             
-            if self.debug:
-                print("\nDebug: Updated JVM settings:")
-                print(''.join(new_lines))
+            log.debug("\nDebug: Updated JVM settings:\n%s", updated_jvm)
             
-            # Verify the settings after update
-            self.check_jvm_heap()
+            # Verify the settings after update; this parses the text just written, kept by _atomic_write
+            if not self.check_jvm_heap():
+                raise RuntimeError(f"{OPENSEARCH_JVM_FILE} still fails verification after the update")
                 
         except Exception as e:
-            print(f"✗ Error updating JVM heap settings: {str(e)}")
+            log.error("✗ Error updating JVM heap settings: %s", e)
             raise
 
     def check_jvm_heap(self):
-        print("\nVerifying JVM heap settings...")
-        required_settings = {
-            '-Xms': '8g',
-            '-Xmx': '8g'
-        }
-        
+        """Verify the heap settings, reusing the cached file contents when it is unchanged"""
+        log.info("\nVerifying JVM heap settings...")
+        required_settings = _REQUIRED_JVM
+
         try:
-            with open(OPENSEARCH_JVM_FILE, 'r') as f:
-                lines = f.readlines()
-            
-            found_settings = {}
-            for line in lines:
-                line = line.strip()
-                if line.startswith('-Xms'):
-                    found_settings['-Xms'] = line[4:]
-                elif line.startswith('-Xmx'):
-                    found_settings['-Xmx'] = line[4:]
+            # One C-level scan of the whole file; the JVM honours the last occurrence
+            # of each option, and dict() keeps the last value for each key
+            found_settings = dict(_HEAP_OPT_RE.findall(self._read_cached(OPENSEARCH_JVM_FILE)))
             
             # Check if all required settings are present and correct
             all_correct = True
             for key, expected_value in required_settings.items():
                 if key not in found_settings:
-                    print(f"✗ Missing setting: {key}")
+                    log.error("✗ Missing setting: %s", key)
                     all_correct = False
                 elif found_settings[key] != expected_value:
-                    print(f"✗ Incorrect value for {key}. Expected: {expected_value}, Found: {found_settings[key]}")
+                    log.error("✗ Incorrect value for %s. Expected: %s, Found: %s", key, expected_value, found_settings[key])
                     all_correct = False
-                elif self.debug:
-                    print(f"✓ Verified {key}: {found_settings[key]}")
+                else:
+                    log.debug("✓ Verified %s: %s", key, found_settings[key])
             
             if all_correct:
-                print("✓ All JVM heap settings are correct")
+                log.info("✓ All JVM heap settings are correct")
                 return True
             else:
-                print("✗ Some JVM heap settings are missing or incorrect")
+                log.error("✗ Some JVM heap settings are missing or incorrect")
                 return False
                 
         except Exception as e:
-            print(f"✗ Error verifying JVM heap settings: {str(e)}")
+            log.error("✗ Error verifying JVM heap settings: %s", e)
             return False
 
     def run_installation(self):
-        self.opensearch_install()
-        self.service_wrapper()
-        self.configuration_wrapper()
-        self.dashboard_install()
+        _check_modules()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Fetch the Dashboard RPM in the background while OpenSearch installs
+            dashboard_download = executor.submit(self.download_dashboard)
+            self.opensearch_install()
+            self.configuration_wrapper()  # Config must be in place before the first start
+            self.service_wrapper()
+            if not self.verification_wrapper():
+                raise RuntimeError(f"{OPENSEARCH_SERVICE_NAME} post-install verification failed")
+            dashboard_download.result()
+        if not self.dashboard_install():
+            raise RuntimeError(f"{DASHBOARD_SERVICE_NAME} installation failed")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description=f"{OPENSEARCH_SERVICE_NAME} Installer")
-    parser.add_argument("--download", "-d", action="store_true", help=f"Download {OPENSEARCH_SERVICE_NAME} package only, do not install or start the service.")
+    parser.add_argument("--download", "-d", action="store_true", help=f"Download the {OPENSEARCH_SERVICE_NAME} and {DASHBOARD_SERVICE_NAME} packages only, do not install or start the services.")
     parser.add_argument("--version", "-v", type=str, default=OPENSEARCH_VERSION, help=f"Specify the {OPENSEARCH_SERVICE_NAME} version to install.")
     parser.add_argument("--debug", action="store_true", help="Enable debug output")
-    parser.add_argument("--api", action="store_true", help="Only run the API verification test")
-    parser.add_argument("--plugins", action="store_true", help="Only run the plugins endpoint test")
+    parser.add_argument("--no-cache", action="store_true", help="Check the server for newer RPMs instead of reusing ones already downloaded")
+    parser.add_argument("--api", action="store_true", help="Only run the API verification test (combinable with other checks)")
+    parser.add_argument("--plugins", action="store_true", help="Only run the plugins endpoint test (combinable with other checks)")
     parser.add_argument("--checkconfig", action="store_true", help=f"Verify {OPENSEARCH_SERVICE_NAME} configuration settings")
     parser.add_argument("--checkjvm", action="store_true", help="Verify JVM heap settings")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO,
+                        format="%(asctime)s %(levelname)s %(message)s" if args.debug else "%(message)s",
+                        stream=sys.stdout)
+    # urllib3 warns on every adapter retry, which floods the output while the API is still starting
+    logging.getLogger("urllib3").setLevel(logging.DEBUG if args.debug else logging.ERROR)
     
-    installer = OpenSearchInstaller(args.version, ADMIN_PASSWORD, debug=args.debug)
-
-    if args.api:
-        installer.api_verify()  # Only run API verification
-    elif args.plugins:
-        installer.plugins_verify()  # Only run plugins verification
-    elif args.checkconfig:
-        installer.verify_config()  # Only verify configuration
-    elif args.checkjvm:
-        installer.check_jvm_heap()  # Only verify JVM settings
-    elif args.download:
-        print("Downloading OpenSearch package...")
-        installer.download_opensearch()  # Download OpenSearch package
-    else:
-        installer.run_installation()  # Proceed with installation and service management
+    installer = OpenSearchInstaller(args.version, ADMIN_PASSWORD, debug=args.debug, use_cache=not args.no_cache)
+
+    # Verification flags can be combined; they touch independent resources so run them together
+    actions = {
+        "api": installer.api_verify,  # API verification
+        "plugins": installer.plugins_verify,  # Plugins verification
+        "checkconfig": installer.verify_config,  # Configuration verification
+        "checkjvm": installer.check_jvm_heap,  # JVM settings verification
+    }
+    checks = [action for flag, action in actions.items() if getattr(args, flag)]
+
+    # Installer methods raise on failure and checks return False; report it once here and exit non-zero
+    try:
+        if checks:
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                results = list(executor.map(lambda check: check(), checks))
+            if not all(results):
+                sys.exit(1)
+        elif args.download:
+            log.info("Downloading OpenSearch packages...")
+            installer._download_all()  # Download OpenSearch and Dashboard packages
+        else:
+            installer.run_installation()  # Proceed with installation and service management
+    except Exception as e:
+        log.debug("Traceback:", exc_info=True)
+        log.error("\n✗ %s", e)
+        sys.exit(1)
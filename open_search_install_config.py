@@ -20,6 +20,9 @@ OPENSEARCH_CONFIG_FILE = f"{OPENSEARCH_CONFIG_DIR}/opensearch.yml"
 OPENSEARCH_JVM_FILE = f"{OPENSEARCH_CONFIG_DIR}/jvm.options"
 OPENSEARCH_RPM_FILENAME = lambda version: f"opensearch-{version}-linux-x64.rpm"
 OPENSEARCH_RPM_URL = lambda version: f"https://artifacts.opensearch.org/releases/bundle/opensearch/{version}/opensearch-{version}-linux-x64.rpm" 
+# Expected SHA-256 digests of the OpenSearch RPM, keyed by version (the .sha512
+# published next to the RPM is checked instead when absent)
+OPENSEARCH_RPM_SHA256 = {}
 
 
 DASHBOARD_CONFIG_DIR = "/etc/opensearch-dashboards"
@@ -27,5 +30,8 @@ DASHBOARD_SERVICE_NAME = "opensearch-dashboards"
 DASHBOARD_CONFIG_FILE = f"{DASHBOARD_CONFIG_DIR}/opensearch_dashboards.yml"
 DASHBOARD_RPM_FILENAME = lambda version: f"opensearch-dashboards-{version}-linux-x64.rpm"
 DASHBOARD_RPM_URL = lambda version: f"https://artifacts.opensearch.org/releases/bundle/opensearch-dashboards/{version}/opensearch-dashboards-{version}-linux-x64.rpm"
+# Expected SHA-256 digests of the Dashboard RPM, keyed by version (the .sha512
+# published next to the RPM is checked instead when absent)
+DASHBOARD_RPM_SHA256 = {}
 
     
\ No newline at end of file